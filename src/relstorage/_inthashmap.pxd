@@ -219,5 +219,6 @@ cdef class OidTidMap:
     cdef bint contains(self, OID_t key) except -1
     cdef int set(self, OID_t key, TID_t value) except -1
     cdef void update_from_other_map(self, OidTidMap other) except +
+    cdef void update_missing_from_other_map(self, OidTidMap other) except +
 
 cdef VectorOidType multiunion(list maps, size_t total_size) except +
@@ -204,6 +204,16 @@ cdef class OidTidMap:
             # Support dicts or sequences
             data = data.items()
 
+        try:
+            size_hint = len(data)
+        except TypeError:
+            # An iterator; it will grow as needed.
+            pass
+        else:
+            # Polling hands us a list of rows; size the table once
+            # instead of rehashing repeatedly as it fills.
+            self._map.reserve(self._map.size() + size_hint)
+
         for k, v in data:
             if k < 0 or v < 0:
                 raise TypeError((k, v))
@@ -215,9 +225,17 @@ cdef class OidTidMap:
         # more seriously, the variants on insert only put in *missing* keys.
         # We want update to *replace* keys. merge has the same problem,
         # plus some of its own. Perhaps one of the copy() algorithms?
+        self._map.reserve(self._map.size() + other._map.size())
         for pair in other._map:
             self._map[pair.first] = pair.second
 
+    cdef void update_missing_from_other_map(self, OidTidMap other) except +:
+        # Here, the fact that insert() only adds missing keys is
+        # exactly what we want: existing entries win.
+        self._map.reserve(self._map.size() + other._map.size())
+        for pair in other._map:
+            self._map.insert(pair)
+
     cpdef OidTidMap difference(self, OidTidMap other):
         """
         Return a new OidTidMap containing the keys from *self* for which
@@ -230,6 +248,24 @@ cdef class OidTidMap:
                 result.set(pair.first, pair.second)
         return result
 
+    def keys_with_other_values(self, value):
+        """
+        Return a new `OidSet` containing the keys from *self* whose
+        value is not *value*. If *value* is None, all keys are returned.
+        """
+        cdef OidSet result = OidSet()
+        cdef TID_t tid
+        result._set.reserve(self._map.size())
+        if value is None:
+            for pair in self._map:
+                result._set.insert(pair.first)
+        else:
+            tid = value
+            for pair in self._map:
+                if pair.second != tid:
+                    result._set.insert(pair.first)
+        return result
+
     def values(self):
         return _OidTidMapValuesView.__new__(_OidTidMapValuesView, self)
 
@@ -70,7 +70,12 @@ cdef class _TransactionRangeObjectIndex:
         self._complete_since_tid = complete_since_tid if complete_since_tid is not None else -1
         self.accepts_writes = True
 
-        self.bucket = OidTidMap(data)
+        if type(data) is OidTidMap:
+            # A freshly polled map; take it over instead of copying it.
+            # The caller must not use it again.
+            self.bucket = <OidTidMap>data
+        else:
+            self.bucket = OidTidMap(data)
 
         if self.size():
             # Verify the data matches what they told us.
@@ -159,11 +164,9 @@ cdef class _TransactionRangeObjectIndex:
         Does not modify the *bucket*.
         """
         assert bucket.highest_visible_tid <= self.highest_visible_tid
-        #debug('Diff between self', dict(self), "and", dict(bucket), items_not_in_self)
         # bring missing data into ourself, being careful not to overwrite
         # things we do have.
-        # XXX: This could be one C call instead of two.
-        self.bucket.update(bucket.items_not_in(self))
+        self.bucket.update_missing_from_other_map(bucket.bucket)
         if bucket._complete_since_tid != -1 \
            and bucket._complete_since_tid < self._complete_since_tid:
             self._complete_since_tid = bucket._complete_since_tid
@@ -211,12 +214,6 @@ cdef class _TransactionRangeObjectIndex:
             return self.bucket[key]
         raise KeyError(key)
 
-    cpdef items_not_in(self, _TransactionRangeObjectIndex other):
-        """
-        Return the ``(k, v)`` pairs in self whose ``k`` is not found in *other*
-        """
-        return self.bucket.difference(other.bucket)
-
     def __repr__(self):
         return '<%s at 0x%x hvt=%s complete_after=%s len=%s readonly=%s>' % (
             self.__class__.__name__,
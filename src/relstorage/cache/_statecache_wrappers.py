@@ -35,30 +35,53 @@ class MultiStateCache(object):
     semi-recommended, we can just use that object directly.
     """
 
-    __slots__ = ('l', 'g')
+    __slots__ = ('l', 'g', '_g_pending')
+
+    #: How many individual stores into the global cache
+    #: (from loading objects that weren't in either cache) we
+    #: buffer before sending them in a single batch.
+    #: They're also sent when a transaction finishes, when
+    #: the next one begins (see :meth:`flush`), and when
+    #: this object is released.
+    max_pending = 32
 
     def __init__(self, lcache, gcache):
         self.l = lcache
         self.g = gcache
+        # {(oid, tid): (state, tid)} waiting to be sent to the global cache.
+        self._g_pending = {}
+
+    def flush(self):
+        pending = self._g_pending
+        if pending:
+            self._g_pending = {}
+            self.g.set_multi(pending)
 
     def close(self):
         if self.l is not None:
-            self.l.close()
-            self.g.close()
-            self.l = None
-            self.g = None
+            try:
+                self.flush()
+            finally:
+                self.l.close()
+                self.g.close()
+                self.l = None
+                self.g = None
 
     def release(self):
         if self.l is not None:
-            self.l.release()
-            self.g.release()
-            self.l = None
-            self.g = None
+            try:
+                self.flush()
+            finally:
+                self.l.release()
+                self.g.release()
+                self.l = None
+                self.g = None
 
     def new_instance(self):
         return type(self)(self.l.new_instance(), self.g.new_instance())
 
     def flush_all(self):
+        self._g_pending.clear()
         self.l.flush_all()
         self.g.flush_all()
 
@@ -83,10 +106,16 @@ class MultiStateCache(object):
         return result
 
     def __setitem__(self, key, value):
+        # The local cache is updated immediately, but the global cache
+        # is a network round trip, so we batch those up.
         self.l[key] = value
-        self.g[key] = value
+        pending = self._g_pending
+        pending[key] = value
+        if len(pending) >= self.max_pending:
+            self.flush()
 
     def __delitem__(self, key):
+        self._g_pending.pop(key, None)
         del self.l[key]
         del self.g[key]
 
@@ -100,10 +129,12 @@ class MultiStateCache(object):
         # of the local cache. (Indeed, simply calling list() to materialize
         # the iterator is probably usually sufficient, except for those very, very
         # large cases.)
+        self.flush()
         self.l.set_all_for_tid(tid_int, state_oid_iter)
         self.g.set_all_for_tid(tid_int, state_oid_iter)
 
     def invalidate_all(self, oids):
+        self._g_pending.clear()
         self.l.invalidate_all(oids)
         self.g.invalidate_all(oids)
 
@@ -142,6 +173,23 @@ class TracingStateCache(object):
     def __getattr__(self, name):
         return getattr(self.cache, name)
 
+    # Untraced operations that we use frequently are delegated
+    # directly rather than going through ``__getattr__`` each time.
+    # (``__contains__`` must be defined here; special methods are not
+    # looked up with ``__getattr__``.)
+
+    def __contains__(self, key):
+        return key in self.cache
+
+    def invalidate_all(self, oids):
+        self.cache.invalidate_all(oids)
+
+    def flush(self):
+        self.cache.flush()
+
+    def flush_all(self):
+        self.cache.flush_all()
+
     def __getitem__(self, key, peek=False):
         oid_int, tid_int = key
         cache_data = self.cache.get(key, peek)
@@ -39,6 +39,7 @@ from relstorage.cache.c_cache cimport Generation
 from relstorage.cache.c_cache cimport move
 from relstorage.cache.c_cache cimport TempCacheFiller
 from relstorage.cache.c_cache cimport ProposedCacheEntry
+from relstorage._inthashmap cimport OidTidMap
 
 
 import sys
@@ -395,6 +396,40 @@ cdef class PyCache:
         # single values can be in the cache at this time.
         return True
 
+    def oids_without_tids(self, current_tids):
+        """
+        For use during cache validation, with the same restrictions
+        as `contains_oid_with_tid`.
+
+        Return a list of the OIDs in the cache that don't have an
+        entry for the TID recorded for them in the mapping *current_tids*
+        (including those that aren't in *current_tids* at all). This
+        is the same as calling `contains_oid_with_tid` for each OID,
+        but done in a single pass in C++.
+
+        Not thread safe.
+        """
+        cdef list result = []
+        cdef OID_t key
+        cdef TID_t native_tid
+        cdef OidTidMap known_tids = (
+            current_tids
+            if isinstance(current_tids, OidTidMap)
+            else OidTidMap(current_tids)
+        )
+        it = self.cache.begin()
+        end = self.cache.end()
+        known_end = known_tids._map.end()
+
+        while it != end:
+            key = deref(it).key
+            found = known_tids._map.find(key)
+            native_tid = -1 if found == known_end else deref(found).second
+            if not self.cache.peek(key, native_tid):
+                result.append(key)
+            preincr(it)
+        return result
+
     def __getitem__(self, OID_t key):
         return self.get(key)
 
@@ -464,6 +499,28 @@ cdef class PyCache:
             yield (deref(it).key, python_from_entry(deref(it)))
             preincr(it)
 
+    def iteritems_newer_than(self, OidTidMap known_tids):
+        """
+        Iterate across the oid/cache_value pairs whose newest cached
+        TID is greater than the TID recorded for the OID in
+        *known_tids*. OIDs not in *known_tids* are always included.
+
+        The comparison happens in C++ during a single pass over the
+        cache; entries that are filtered out never become Python
+        objects.
+
+        Not thread safe.
+        """
+        it = self.cache.begin()
+        end = self.cache.end()
+        known_end = known_tids._map.end()
+
+        while it != end:
+            found = known_tids._map.find(deref(it).key)
+            if found == known_end or deref(found).second < deref(it).newest_tid():
+                yield (deref(it).key, python_from_entry(deref(it)))
+            preincr(it)
+
     def keys(self):
         """
         Iterate across the OIDs in the cache.
@@ -497,12 +554,26 @@ cdef class PyCache:
         # or otherwise not implemented in pure-python
         cdef OID_t oid_int
         for state_bytes, oid_int, _ in state_oid_iter:
-            state_bytes = compress(state_bytes) if compress is not None else state_bytes
-            state_bytes = state_bytes if state_bytes is not None else b''
-            if len(state_bytes) >= value_limit:
-                # This value is too big, so don't cache it.
-                continue
-            self._do_set(oid_int, state_bytes, tid_int)
+            self._compress_and_set(oid_int, state_bytes, tid_int, compress, value_limit)
+
+    cpdef set_item_with_tid(self, OID_t key, TID_t tid, state_bytes,
+                            compress, Py_ssize_t value_limit):
+        """
+        Like :meth:`set_all_for_tid`, but for a single object.
+
+        This is what we use to cache an object we had to load from
+        the database.
+        """
+        self._compress_and_set(key, state_bytes, tid, compress, value_limit)
+
+    cdef _compress_and_set(self, OID_t key, object state_bytes, TID_t tid,
+                           compress, Py_ssize_t value_limit):
+        state_bytes = compress(state_bytes) if compress is not None else state_bytes
+        state_bytes = state_bytes if state_bytes is not None else b''
+        if len(state_bytes) >= value_limit:
+            # This value is too big, so don't cache it.
+            return
+        self._do_set(key, state_bytes, tid)
 
 
     def add_MRUs(self, ordered_keys, return_count_only=False):
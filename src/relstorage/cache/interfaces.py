@@ -178,6 +178,14 @@ class IStateCache(Interface):
         created for MVCC using a ``new_instance`` method.
         """
 
+    def flush():
+        """
+        Send any writes this object has buffered on to the underlying
+        storage.
+
+        This is called at transaction boundaries.
+        """
+
     def flush_all():
         """
         Clear cached data.
@@ -318,6 +318,9 @@ class LocalClient(object):
         # only for a short time.
         self.flush_all()
 
+    def flush(self):
+        "Nothing is buffered."
+
     def flush_all(self):
         if self._cache or self._cache is None:
             # Only actually abandon the cache object
@@ -376,7 +379,15 @@ class LocalClient(object):
             state, tid = value
             return ((decompress(state) if state else state), tid)
 
-    __getitem__ = get
+    def __getitem__(self, oid_tid):
+        # This is what ``StorageCache.load`` uses for every object.
+        # It's ``get()`` specialized for the non-peeking case, with
+        # the argument handling and branches that implies removed.
+        oid, tid = oid_tid
+        value = self._cache.get_item_with_tid(oid, tid)
+        if value is not None:
+            state, tid = value
+            return ((self._decompress(state) if state else state), tid)
 
     def _age(self):
         # Age only when we're full and would thus need to evict; this
@@ -424,7 +435,10 @@ class LocalClient(object):
 
         # Really key_tid should be > 0; we allow >= for tests.
         assert key_tid == actual_tid and key_tid >= 0
-        self.set_all_for_tid(key_tid, [(state_bytes, oid, None)])
+        self._cache.set_item_with_tid(oid, key_tid, state_bytes, self._compress, self._value_limit)
+        # As in set_all_for_tid.
+        if self._cache.hits + self._cache.sets > self._next_age_at:
+            self._age()
 
     def set_all_for_tid(self, tid_int, state_oid_iter):
         if self.limit:
@@ -529,12 +543,13 @@ class LocalClient(object):
             size = 0
             limit = self.limit
             items = []
+            append = items.append
             rows = db.fetch_rows_by_priority()
             for oid, frozen, state, actual_tid, frequency in rows:
                 size += len(state)
                 if size > limit:
                     break
-                items.append((oid, (state, actual_tid, frozen, frequency)))
+                append((oid, (state, actual_tid, frozen, frequency)))
             consume(rows)
             # Rows came to us MRU to LRU, but we need to feed them the other way.
             items.reverse()
@@ -588,38 +603,29 @@ class LocalClient(object):
 
         # The *object_index* is our best polling data; anything it has it gospel,
         # so if it has an entry for an object, it superceeds our own.
-        get_current_oid_tid = stored_oid_tid.get
-        matching_tid_count = 0
+        #
+        # If we have something matching what's in the database, or
+        # even older (somehow), it's not worth writing to the database
+        # (states should be identical). The cache makes that comparison
+        # in C as it iterates, so we only see the entries we need to write.
+        written_count = 0
         # When we accumulate all the rows here before returning them,
         # this function shows as about 3% of the total time to save
         # in a very large database.
         with _timer() as t:
-            for oid, lru_entry in self._cache.iteritems():
+            for oid, lru_entry in self._cache.iteritems_newer_than(stored_oid_tid):
                 newest_value = lru_entry.newest_value
                 # We must have something at least this fresh
                 # to consider writing it out
                 if newest_value is None:
                     raise AssertionError("Value should not be none", oid, lru_entry)
-                actual_tid = newest_value.tid
-
-                # If we have something >= min_allowed, matching
-                # what's in the database, or even older (somehow),
-                # it's not worth writing to the database (states should be identical).
-                current_tid = get_current_oid_tid(oid, -1)
-                if current_tid >= actual_tid:
-                    matching_tid_count += 1
-                    continue
 
-                yield (oid, actual_tid, newest_value.frozen,
+                written_count += 1
+                yield (oid, newest_value.tid, newest_value.frozen,
                        bytes(newest_value.state),
                        lru_entry.frequency)
 
-                # We're able to satisfy this, so we don't need to consider
-                # it in our min_allowed set anymore.
-                # XXX: This isn't really the right place to do this.
-                # Move this and write a test.
-
-
+        matching_tid_count = all_entries_len - written_count
         removed_entry_count = matching_tid_count
         logger.info(
             "Storing persistent cache: Examined %d entries and rejected %d "
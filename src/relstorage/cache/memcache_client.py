@@ -22,15 +22,21 @@ from __future__ import division
 from __future__ import print_function
 
 import importlib
+import struct
 
-from ZODB.utils import p64
-from ZODB.utils import u64
 from zope import interface
 
 from relstorage._compat import string_types
 from relstorage._compat import iteritems
 from relstorage.cache.interfaces import IStateCache
 
+# Cache values are the 8-byte big-endian TID followed by the state.
+# Using the struct methods directly instead of ZODB's p64/u64 avoids a
+# Python function call, and unpack_from avoids slicing out the TID.
+_TID_STRUCT = struct.Struct('>Q')
+_pack_tid = _TID_STRUCT.pack
+_unpack_tid_from = _TID_STRUCT.unpack_from
+
 
 @interface.implementer(IStateCache)
 class MemcacheStateCache(object):
@@ -66,9 +72,19 @@ class MemcacheStateCache(object):
         self.checkpoints_key = ck = '%s:checkpoints' % self.prefix
         # no unicode on Py2
         assert isinstance(ck, str), (ck, type(ck))
+        if not isinstance(ck, bytes):
+            ck = ck.encode('utf-8')
+        self._checkpoints_key_bytes = ck
+        # State keys are built as bytes from this precomputed prefix;
+        # that way the client doesn't have to encode a new text key
+        # for every object we get or set.
+        state_key_prefix = '%s:state:' % self.prefix
+        if not isinstance(state_key_prefix, bytes):
+            state_key_prefix = state_key_prefix.encode('utf-8')
+        self._state_key_prefix = state_key_prefix
 
     def __oid_tid_to_key(self, oid, tid):
-        return '%s:state:%d:%d' % (self.prefix, tid, oid)
+        return self._state_key_prefix + b'%d:%d' % (tid, oid)
 
     def __getitem__(self, oid_tid, peek=False):
         oid, tid = oid_tid
@@ -76,13 +92,10 @@ class MemcacheStateCache(object):
             # We don't support frozen keys, only those in the index
             return None
 
-        cachekeys = [self.__oid_tid_to_key(oid, tid)]
-        response = self.client.get_multi(cachekeys) or {}
-        for key in cachekeys:
-            data = response.get(key)
-            if data and len(data) >= 8:
-                actual_tid_int = u64(data[:8])
-                return data[8:], actual_tid_int
+        data = self.client.get(self.__oid_tid_to_key(oid, tid))
+        if data and len(data) >= 8:
+            actual_tid_int = _unpack_tid_from(data)[0]
+            return data[8:], actual_tid_int
 
     get = __getitem__
 
@@ -93,7 +106,7 @@ class MemcacheStateCache(object):
         oid, tid = oid_tid
         key = self.__oid_tid_to_key(oid, tid)
         state_bytes, actual_tid = state_bytes_tid
-        cache_data = p64(actual_tid) + (state_bytes or b'')
+        cache_data = _pack_tid(actual_tid) + (state_bytes or b'')
         self.client.set(key, cache_data)
 
     def __delitem__(self, oid_tid):
@@ -105,37 +118,47 @@ class MemcacheStateCache(object):
         """
         self.flush_all()
 
-    def _set_multi(self, keys_and_values):
+    def set_multi(self, keys_and_values):
+        """
+        Store each ``(state_bytes, tid_int)`` value in *keys_and_values*
+        under its ``(oid, tid)`` key in one request.
+        """
+        key = self.__oid_tid_to_key
         formatted = {
-            '%s:state:%d:%d' % (self.prefix, tid, oid): (p64(actual_tid) + (state or b''))
+            key(oid, tid): (_pack_tid(actual_tid) + (state or b''))
             for (oid, tid), (state, actual_tid) in iteritems(keys_and_values)
         }
         self.client.set_multi(formatted)
 
     def set_all_for_tid(self, tid_int, state_oid_iter):
+        # Every key and value shares the same TID, so format them
+        # directly as we go instead of collecting ``(oid, tid)``
+        # tuples and formatting them again in ``set_multi``.
+        tid_bytes = _pack_tid(tid_int)
+        key = self.__oid_tid_to_key
+        send_limit = self.send_limit
+        client_set_multi = self.client.set_multi
         send_size = 0
         to_send = {}
         for state, oid_int, _ in state_oid_iter:
-            length = len(state)
-            cachekey = (oid_int, tid_int)
-            item_size = length + len(cachekey)
-            if send_size and send_size + item_size >= self.send_limit:
-                self._set_multi(to_send)
-                to_send.clear()
+            cachekey = key(oid_int, tid_int)
+            cache_data = tid_bytes + (state or b'')
+            item_size = len(cachekey) + len(cache_data)
+            if send_size and send_size + item_size >= send_limit:
+                client_set_multi(to_send)
+                to_send = {}
                 send_size = 0
-            to_send[cachekey] = (state, tid_int)
+            to_send[cachekey] = cache_data
             send_size += item_size
 
         if to_send:
-            self._set_multi(to_send)
+            client_set_multi(to_send)
 
     def store_checkpoints(self, cp0_tid, cp1_tid):
-        checkpoint_data = '%d %d' % (cp0_tid, cp1_tid)
-        checkpoint_data = checkpoint_data.encode('ascii')
-        self.client.set(self.checkpoints_key, checkpoint_data)
+        self.client.set(self._checkpoints_key_bytes, b'%d %d' % (cp0_tid, cp1_tid))
 
     def get_checkpoints(self):
-        s = self.client.get(self.checkpoints_key)
+        s = self.client.get(self._checkpoints_key_bytes)
         if s:
             try:
                 c0, c1 = s.split()
@@ -162,6 +185,9 @@ class MemcacheStateCache(object):
 
     release = close
 
+    def flush(self):
+        "Nothing is buffered."
+
     def flush_all(self):
         self.client.flush_all()
 
@@ -27,7 +27,6 @@ from zope.interface import implementer
 
 from relstorage._inthashmap import OidTidMap as OidTMap # pylint:disable=no-name-in-module
 from relstorage._inthashmap import OidSet # pylint:disable=no-name-in-module
-from relstorage._compat import iteroiditems
 
 from relstorage._util import log_timed
 from relstorage._util import get_positive_integer_from_environ
@@ -226,8 +225,13 @@ class MVCCDatabaseCoordinator(DetachableMVCCDatabaseCoordinator):
         # Ok cool, we got data to move us forward.
         # We must be careful to always consume the iterator, even if we exit early
         # (because it could be a server-side cursor holding connection state).
-        # So we do that now.
-        change_iter = list(change_iter)
+        # So we do that now. Collecting the rows directly into a map
+        # converts them from Python objects once, in C, and
+        # before we take the lock; the index then adopts the
+        # native map as its new transaction range without copying it.
+        # An idle poll gives us an empty sequence; there's nothing to collect.
+        if change_iter:
+            change_iter = OidTMap(change_iter)
         self.log(
             LTRACE,
             "Polled new tid %s since %s with %s changes",
@@ -314,7 +318,7 @@ class MVCCDatabaseCoordinator(DetachableMVCCDatabaseCoordinator):
     def _find_changes_for_viewer(viewer, object_index):
         """
         Given a freshly polled *object_index*, and the *viewer* that polled
-        for it, build a changes iterator.
+        for it, build an OidTidMap of the changes it needs to see.
 
         Call this **before** updating the viewer's MVCC state, so that
         we know how far back we need to build the changes.
@@ -344,9 +348,7 @@ class MVCCDatabaseCoordinator(DetachableMVCCDatabaseCoordinator):
         # matching the last time this viewer polled. Everything from there
         # forward is a change that this viewer needs to see.
         # Note there could be no changes.
-        changes = object_index.collect_changes_after(viewer.highest_visible_tid)
-
-        return iteroiditems(changes)
+        return object_index.collect_changes_after(viewer.highest_visible_tid)
 
     @log_timed
     def _vacuum(self, cache, object_index):
@@ -462,7 +464,8 @@ class MVCCDatabaseCoordinator(DetachableMVCCDatabaseCoordinator):
         if not self.object_index or not self.object_index.maximum_highest_visible_tid:
             # We have never polled or verified anything, don't
             # try to save what we can't validated.
-            logger.debug("No index or HVT; nothing to save %s", self.stats())
+            if logger.isEnabledFor(LDEBUG):
+                logger.debug("No index or HVT; nothing to save %s", self.stats())
             return
         # Vacuum, disposing of uninteresting and duplicate data.
         # We should have no viewers, so we eliminated all except the final map.
@@ -543,13 +546,9 @@ class MVCCDatabaseCoordinator(DetachableMVCCDatabaseCoordinator):
                 return ex.partial_result
 
         current_tids = adapter.connmanager.open_and_call(poll_cached_oids)
-        current_tid = current_tids.get
-        polled_invalid_oids = OidSet()
-        cache_is_correct = local_client._cache.contains_oid_with_tid
-
-        for oid_int in cached_oids:
-            if not cache_is_correct(oid_int, current_tid(oid_int)):
-                polled_invalid_oids.add(oid_int)
+        # Anything whose cached TID doesn't match what we found is invalid;
+        # the comparisons are done in C++.
+        polled_invalid_oids = OidSet(local_client._cache.oids_without_tids(current_tids))
 
         logger.info("Polled %d older oids stored in cache (%d found in database); %d survived",
                     len(cached_oids), len(current_tids),
@@ -27,7 +27,6 @@ from ZODB.utils import p64
 from zope import interface
 
 from relstorage._compat import IN_TESTRUNNER
-from relstorage._compat import OID_SET_TYPE as OIDSet
 from relstorage._compat import OID_TID_MAP_TYPE as OidTMap
 from relstorage._util import bytes8_to_int64
 from relstorage._mvcc import DetachableMVCCDatabaseViewer
@@ -307,6 +306,20 @@ class StorageCache(DetachableMVCCDatabaseViewer):
                               expect_tid_int=None,
                               cursor=None):
         """Verify the tid of an object loaded from the database is sane."""
+        if (
+                (actual_tid_int is not None and actual_tid_int > self.highest_visible_tid)
+                or (expect_tid_int is not None and actual_tid_int != expect_tid_int)
+        ):
+            self._raise_tid_conflict(oid_int, actual_tid_int, expect_tid_int, cursor)
+
+    def _raise_tid_conflict(self, oid_int, actual_tid_int, expect_tid_int, cursor):
+        """
+        The slow path of `_check_tid_after_load`: the tid didn't match
+        what we expected. Raise an appropriate error.
+
+        This is kept separate so that the common, successful, case
+        has as little to do as possible.
+        """
         if actual_tid_int is not None and actual_tid_int > self.highest_visible_tid:
             # Strangely, the database just gave us data from a future
             # transaction. We can't give the data to ZODB because that
@@ -369,9 +382,13 @@ class StorageCache(DetachableMVCCDatabaseViewer):
                        'expect_tid_int': expect_tid_int,
                        'actual_tid_int': actual_tid_int,
                        # Typically if this happens we get something newer than we expect.
-                       'actual_expect_delta': actual_tid_int - expect_tid_int,
+                       'actual_expect_delta': (actual_tid_int - expect_tid_int
+                                               if actual_tid_int is not None
+                                               else None),
                        'expect_tid': str(TimeStamp(int64_to_8bytes(expect_tid_int))),
-                       'actual_tid': str(TimeStamp(int64_to_8bytes(actual_tid_int))),
+                       'actual_tid': (str(TimeStamp(int64_to_8bytes(actual_tid_int)))
+                                      if actual_tid_int is not None
+                                      else None),
                        'current_tid': self.highest_visible_tid,
                        'pid': os.getpid(),
                        'thread_ident': threading.current_thread(),
@@ -457,7 +474,9 @@ class StorageCache(DetachableMVCCDatabaseViewer):
             cursor, oid_int)
         if actual_tid_int:
             # If either is None, the object was deleted.
-            self._check_tid_after_load(oid_int, actual_tid_int, indexed_tid_int, cursor)
+            if actual_tid_int > self.highest_visible_tid or (
+                    indexed_tid_int is not None and actual_tid_int != indexed_tid_int):
+                self._raise_tid_conflict(oid_int, actual_tid_int, indexed_tid_int, cursor)
 
             # We may or may not have had an index entry, but make sure we do now.
             # Eventually this will age to be frozen again if needed.
@@ -495,10 +514,10 @@ class StorageCache(DetachableMVCCDatabaseViewer):
         if not to_fetch:
             return
 
+        check = self._check_tid_after_load
         for oid, state, tid_int in self.adapter.mover.load_currents(cursor, to_fetch):
-            key = (oid, tid_int)
-            self._check_tid_after_load(oid, tid_int, cursor=cursor)
-            cache[key] = (state, tid_int)
+            check(oid, tid_int, cursor=cursor)
+            cache[(oid, tid_int)] = (state, tid_int)
             index[oid] = tid_int # pylint:disable=unsupported-assignment-operation
 
     def prefetch_for_conflicts(self, cursor, oid_tid_pairs):
@@ -573,6 +592,9 @@ class StorageCache(DetachableMVCCDatabaseViewer):
         self.cache.set_all_for_tid(tid_int, temp_storage)
 
     def poll(self, conn, cursor, ignore_tid):
+        # A new transaction is starting; send along anything we loaded
+        # in the last one and left buffered.
+        self.cache.flush()
         try:
             changes = self.polling_state.poll(self, conn, cursor)
         except self.MVCCInternalConsistencyError: # pragma: no cover
@@ -585,7 +607,7 @@ class StorageCache(DetachableMVCCDatabaseViewer):
             self._reset("Unknown internal violation")
 
         if changes is not None:
-            return OIDSet(oid for oid, tid in changes if tid != ignore_tid)
+            return changes.keys_with_other_values(ignore_tid)
 
 
 class _BeforeStorageCache(StorageCache):
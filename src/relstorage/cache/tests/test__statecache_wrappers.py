@@ -27,6 +27,9 @@ from relstorage.cache import _statecache_wrappers as wrappers
 class MockCache(object):
     released = False
 
+    def __setitem__(self, key, value):
+        "Does nothing"
+
     def new_instance(self):
         return type(self)()
 
@@ -56,6 +59,64 @@ class TestMultiStateCache(TestCase):
         self.assertIsNone(child.l)
         self.assertIsNone(child.g)
 
+    def test_global_sets_are_batched(self):
+        class MockClient(dict):
+            set_multis = 0
+            def set_multi(self, keys_and_values):
+                self.set_multis += 1
+                self.update(keys_and_values)
+            def set_all_for_tid(self, tid_int, state_oid_iter):
+                "Does nothing"
+
+        class MultiStateCache(wrappers.MultiStateCache):
+            __slots__ = ()
+            max_pending = 2
+
+        l = MockClient()
+        g = MockClient()
+        c = MultiStateCache(l, g)
+        c[(1, 1)] = (b'abc', 1)
+        self.assertEqual(l, {(1, 1): (b'abc', 1)})
+        self.assertEqual(g, {})
+
+        c[(2, 1)] = (b'def', 1)
+        self.assertEqual(g, l)
+        self.assertEqual(g.set_multis, 1)
+
+        # Deleting drops anything still waiting to be sent.
+        c[(3, 1)] = (b'ghi', 1)
+        g[(3, 1)] = None
+        del c[(3, 1)]
+        c[(4, 1)] = (b'jkl', 1)
+        self.assertEqual(g.set_multis, 1)
+
+        # Finishing a transaction sends whatever is pending.
+        c.set_all_for_tid(2, ())
+        self.assertEqual(g.set_multis, 2)
+        self.assertEqual(sorted(g), [(1, 1), (2, 1), (4, 1)])
+
+        # As does an explicit flush, such as when polling.
+        c[(5, 1)] = (b'mno', 1)
+        c.flush()
+        self.assertEqual(g.set_multis, 3)
+        self.assertIn((5, 1), g)
+        c.flush()
+        self.assertEqual(g.set_multis, 3)
+
+    def test_release_when_flush_fails(self):
+        class BrokenClient(MockCache):
+            def set_multi(self, keys_and_values):
+                raise IOError
+
+        l = MockCache()
+        c = self._makeOne(l, BrokenClient())
+        c[(1, 1)] = (b'abc', 1)
+        with self.assertRaises(IOError):
+            c.release()
+        self.assertTrue(l.released)
+        self.assertIsNone(c.l)
+        self.assertIsNone(c.g)
+
 class MockTracer(object):
     def __init__(self):
         self.trace_events = []
@@ -127,3 +188,11 @@ class TestTracingCacheWrapper(TestCase):
             c.tracer.trace_events,
             [(0x22, 1, 1, 0, 3,)]
         )
+
+    def test_contains_not_traced(self):
+        from . import LocalClient
+        c = self._makeOne(lambda *args: LocalClient(100))
+        c.cache[(1, 1)] = (b'abc', 1)
+        self.assertIn((1, 1), c)
+        self.assertNotIn((1, 2), c)
+        self.assertEqual(c.tracer.trace_events, [])
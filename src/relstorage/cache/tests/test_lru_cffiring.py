@@ -229,6 +229,39 @@ class GenericLRUCacheTests(TestCase):
         self.assertEqual(b'abc', entry.value)
         self.assertEqual(2, entry.frequency)
 
+    def test_iteritems_newer_than(self):
+        from relstorage._compat import OID_TID_MAP_TYPE as OidTMap
+        cache = self._makeOne(100)
+        cache[1] = (b'abc', 1)
+        cache[2] = (b'def', 2)
+        cache[2] = (b'ghi', 3)
+        cache[3] = (b'jkl', 1)
+        known_tids = OidTMap({1: 1, 2: 2, 4: 1})
+        newer = dict(cache.iteritems_newer_than(known_tids))
+        self.assertEqual(sorted(newer), [2, 3])
+        self.assertEqual(newer[2].max_tid, 3)
+        self.assertEqual(newer[3].max_tid, 1)
+
+    def test_oids_without_tids(self):
+        from relstorage._compat import OID_TID_MAP_TYPE as OidTMap
+        cache = self._makeOne(10000)
+        cache.add_MRUs([
+            (1, (b'abc', 1, True, 1)),
+            (2, (b'def', 2, True, 1)),
+            (3, (b'ghi', 3, True, 1)),
+            (4, (b'jkl', 4, False, 1)),
+        ])
+        current_tids = OidTMap({1: 1, 2: 5, 4: 4})
+        result = cache.oids_without_tids(current_tids)
+        self.assertEqual(
+            sorted(result),
+            sorted(oid for oid in (1, 2, 3, 4)
+                   if not cache.contains_oid_with_tid(oid, current_tids.get(oid)))
+        )
+        self.assertIn(2, result)
+        self.assertNotIn(1, result)
+        self.assertNotIn(4, result)
+
     def test_add_too_many_MRUs_works_aronud_big_entry(self):
         cache = self._getClass()(20)
         base_size = cache.base_size
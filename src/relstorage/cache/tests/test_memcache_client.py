@@ -90,3 +90,42 @@ class MemcacheClientTests(AbstractStateCacheTests):
         inst = self._makeOne()
         new = inst.new_instance()
         self.assertIsNot(inst, new)
+
+    def test_state_keys_are_bytes(self):
+        from relstorage.tests.fakecache import data
+        c = self._makeOne()
+        c[(2, 1)] = (b'abc', 1)
+        c.set_all_for_tid(3, [(b'def', 4, -1)])
+        self.assertEqual(sorted(data), [b':state:1:2', b':state:3:4'])
+        self.assertEqual(c[(2, 1)], (b'abc', 1))
+        del c[(2, 1)]
+        self.assertEqual(list(data), [b':state:3:4'])
+
+    def test_set_all_for_tid_respects_send_limit(self):
+        from relstorage.tests.fakecache import data
+        c = self._makeOne()
+        batches = []
+        c.client.set_multi = lambda d: (batches.append(sorted(d)), data.update(d))
+        c.send_limit = 20
+        c.set_all_for_tid(3, [(b'abc', 1, -1), (b'def', 2, -1), (b'ghi', 4, -1)])
+        self.assertEqual(batches, [
+            [b':state:3:1'],
+            [b':state:3:2'],
+            [b':state:3:4'],
+        ])
+        self.assertEqual(data[b':state:3:2'], b'\0' * 7 + b'\3def')
+        c.send_limit = 1024
+        c.set_all_for_tid(5, [(b'abc', 1, -1), (None, 2, -1)])
+        self.assertEqual(batches[-1], [b':state:5:1', b':state:5:2'])
+        self.assertEqual(c[(2, 5)], (b'', 5))
+
+    def test_checkpoints_round_trip(self):
+        from relstorage.tests.fakecache import data
+        c = self._makeOne()
+        self.assertIsNone(c.get_checkpoints())
+        c.store_checkpoints(2, 1)
+        self.assertEqual(data[b':checkpoints'], b'2 1')
+        self.assertEqual(c.get_checkpoints(), (2, 1))
+        self.assertIsNone(c.replace_checkpoints((3, 3), (4, 4)))
+        self.assertEqual(c.replace_checkpoints((2, 1), (4, 4)), (4, 4))
+        self.assertEqual(c.get_checkpoints(), (4, 4))
@@ -134,7 +134,7 @@ class TestMVCCDatabaseCorrdinator(TestCase):
         viewer = viewer or self.viewer
         result = self.coord.poll(viewer, None, None)
         if result:
-            result = list(result)
+            result = sorted(result.items())
 
         self.assertEqual(result, self.expected_poll_result)
         if self.polled_tid:
@@ -476,8 +476,9 @@ class TestMVCCDatabaseCorrdinator(TestCase):
         adapter.connmanager.configure_cursor = configure_cursor
 
         class MockCache(object):
-            def contains_oid_with_tid(self, oid, tid):
-                return oid is not None and tid is not None
+            def oids_without_tids(self, current_tids):
+                from relstorage._compat import OID_SET_TYPE
+                return [oid for oid in OID_SET_TYPE(oids) if current_tids.get(oid) is None]
 
         class MockLocalClient(object):
             _cache = MockCache()
@@ -557,6 +558,17 @@ class TestTransactionRangeObjectIndex(TestCase):
         self.assertEqual(3, c.highest_visible_tid)
         self.assertEqual(1, c.complete_since_tid)
 
+    def test_adopts_native_map(self):
+        from relstorage._inthashmap import OidTidMap
+        data = OidTidMap({1: 2, 2: 3})
+        ix = self._makeOne(3, complete_since_tid=1, data=data)
+        self.assertIs(ix.raw_data, data)
+
+        data = {1: 2}
+        ix = self._makeOne(3, complete_since_tid=1, data=data)
+        self.assertIsNot(ix.raw_data, data)
+        self.assertEqual(dict(ix.raw_data), data)
+
     def test_complete_to(self):
         # This map has no guarantees about completeness and can
         # have values <= 1.
@@ -236,6 +236,21 @@ class StorageCacheTests(TestCase):
         res = c.load(None, 2)
         self.assertEqual(res, (None, None))
 
+    def test_check_tid_after_load(self):
+        from ZODB.POSException import ReadConflictError
+        from relstorage.cache.interfaces import CacheConsistencyError
+        c = self._makeOne()
+        c.highest_visible_tid = 5
+        # The common cases do nothing.
+        c._check_tid_after_load(1, 5)
+        c._check_tid_after_load(1, 4, 4)
+        c._check_tid_after_load(1, None)
+        with self.assertRaises(ReadConflictError):
+            c._check_tid_after_load(1, 6)
+        # The object is gone, but the index said it should be there.
+        with self.assertRaises(CacheConsistencyError):
+            c._check_tid_after_load(1, None, 4)
+
     def test_store_temp(self):
         c = self._makeOne()
         temp_storage = TemporaryStorage()
@@ -243,8 +258,9 @@ class StorageCacheTests(TestCase):
         temp_storage.store_temp(1, b'def')
         temp_storage.store_temp(2, b'ghi')
         self.assertEqual(b'ghi', temp_storage.read_temp(2))
-        self.assertEqual(dict(temp_storage.stored_oids),
-                         {1: (3, 6, 0), 2: (6, 9, 0)})
+        self.assertEqual(sorted(temp_storage.stored_oids), [1, 2])
+        self.assertEqual(temp_storage.items(),
+                         [(3, 6, 1, 0), (6, 9, 2, 0)])
         self.assertEqual(temp_storage.max_stored_oid, 2)
         f = temp_storage._queue
         f.seek(0)
@@ -262,8 +278,8 @@ class StorageCacheTests(TestCase):
         tid = p64(55)
         c.after_tpc_finish(tid, temp_storage)
         self.assertEqual(data, {
-            'myprefix:state:55:2': tid + b'abc',
-            'myprefix:state:55:3': tid + b'def',
+            b'myprefix:state:55:2': tid + b'abc',
+            b'myprefix:state:55:3': tid + b'def',
             })
         self.assertEqual(len(c), 2)
 
@@ -278,8 +294,8 @@ class StorageCacheTests(TestCase):
         tid = p64(55)
         c.after_tpc_finish(tid, temp_storage)
         self.assertEqual(data, {
-            'myprefix:state:55:2': tid + b'abc',
-            'myprefix:state:55:3': tid + (b'def' * 100),
+            b'myprefix:state:55:2': tid + b'abc',
+            b'myprefix:state:55:3': tid + (b'def' * 100),
             })
 
     def test_send_queue_none(self):
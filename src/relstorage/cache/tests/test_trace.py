@@ -0,0 +1,98 @@
+##############################################################################
+#
+# Copyright (c) 2019 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import struct
+from io import BytesIO
+
+from ZODB.utils import p64
+from ZODB.utils import z64
+
+from relstorage.tests import TestCase
+
+class TestZEOTracer(TestCase):
+
+    _HEADER = struct.Struct(">iiH8s8s")
+
+    def _makeOne(self):
+        from relstorage.cache.trace import ZEOTracer
+        return ZEOTracer(BytesIO())
+
+    def _read_records(self, tracer):
+        # Decode the way ZEO's trace analysis tools do.
+        data = tracer._trace_file.getvalue()
+        records = []
+        offset = 0
+        while offset < len(data):
+            ts, encoded, oidlen, start_tid, end_tid = self._HEADER.unpack_from(data, offset)
+            offset += self._HEADER.size
+            oid = data[offset:offset + oidlen]
+            offset += oidlen
+            records.append((ts, encoded & 0x7e, encoded >> 8, oid, start_tid, end_tid))
+        return records
+
+    def test_trace_record_layout(self):
+        tracer = self._makeOne()
+        tracer.trace(0x00)
+        tracer.trace(0x22, 42, 0xDEADBEEF, dlen=1234)
+        tracer.trace(0x52, 0, 7, 9, dlen=3)
+
+        records = self._read_records(tracer)
+        self.assertEqual(
+            [r[1:] for r in records],
+            [
+                (0x00, 0, b'', z64, z64),
+                (0x22, 1234, p64(42), p64(0xDEADBEEF), z64),
+                (0x52, 3, b'', p64(7), p64(9)),
+            ]
+        )
+        for ts, _, _, _, _, _ in records:
+            self.assertGreater(ts, 0)
+
+    def test_trace_store_current_matches_trace(self):
+        from relstorage.cache import trace as trace_module
+
+        class Temp(object):
+            # Like TPCTemporaryStorage: (startpos, endpos, oid_int, prev_tid_int)
+            def items(self):
+                return iter([
+                    (0, 10, 0, 0),
+                    (10, 13, 5, 3),
+                    (13, 13, 2 ** 40, 0),
+                ])
+
+        orig_time = trace_module.time.time
+        trace_module.time.time = lambda: 1234567.5
+        try:
+            bulk = self._makeOne()
+            bulk.trace_store_current(77, Temp())
+
+            single = self._makeOne()
+            for startpos, endpos, oid_int, _ in Temp().items():
+                single.trace(0x52, oid_int, 77, dlen=endpos - startpos)
+        finally:
+            trace_module.time.time = orig_time
+
+        self.assertEqual(bulk._trace_file.getvalue(), single._trace_file.getvalue())
+        records = self._read_records(bulk)
+        self.assertEqual(
+            [r[1:] for r in records],
+            [
+                (0x52, 10, b'', p64(77), z64),
+                (0x52, 3, p64(5), p64(77), z64),
+                (0x52, 0, p64(2 ** 40), p64(77), z64),
+            ]
+        )
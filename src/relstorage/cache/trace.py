@@ -20,8 +20,6 @@ import struct
 import threading
 import time
 
-from ZODB.utils import p64
-from ZODB.utils import z64
 
 log = logging.getLogger(__name__)
 
@@ -37,12 +35,14 @@ class ZEOTracer(object):
         # (going off example in ZEO code; in one test locally this gets us a
         # ~15% improvement)
         _now = time.time
-        _pack = struct.Struct(">iiH8s8s").pack
+        # The TIDs are packed directly as unsigned 64-bit big-endian
+        # integers; that's the same as ZODB.utils.p64 (and 0 is z64),
+        # without calling it for each one.
+        _pack = struct.Struct(">iiHQQ").pack
+        _pack_oid = struct.Struct(">Q").pack
         _trace_file_write = trace_file.write
-        _p64 = p64
-        _z64 = z64
+        _trace_file_writelines = trace_file.writelines
         _int = int
-        _len = len
 
         def trace(code, oid_int=0, tid_int=0, end_tid_int=0, dlen=0, now=None):
             # This method was originally part of ZEO.cache.ClientCache. The below
@@ -52,23 +52,46 @@ class ZEOTracer(object):
             # ...
             # Note: when tracing is disabled, this method is hidden by a dummy.
             encoded = (dlen << 8) + code
-            tid = _p64(tid_int) if tid_int else _z64
-            end_tid = _p64(end_tid_int) if end_tid_int else _z64
-            oid = b'' if not oid_int else _p64(oid_int)
+            oid = b'' if not oid_int else _pack_oid(oid_int)
 
             now = now or _now()
             try:
                 _trace_file_write(
                     _pack(
-                        _int(now), encoded, _len(oid), tid, end_tid) + oid,
+                        _int(now), encoded, 8 if oid else 0,
+                        tid_int or 0, end_tid_int or 0) + oid,
                 )
             except: # pragma: no cover
                 log.exception("Problem writing trace info for %r at tid %r and end tid %r",
-                              oid, tid, end_tid)
+                              oid, tid_int, end_tid_int)
                 raise
 
         self._trace = trace
 
+        def trace_store_current(tid_int, state_oid_iter):
+            # The bulk form of ``trace(0x52, oid_int, tid_int, dlen=...)``:
+            # every record shares a timestamp and TID. The records are
+            # streamed into the (buffered) file with one call, without
+            # holding them all in memory; transactions can be large.
+            now = _int(_now())
+            tid_int = tid_int or 0
+
+            def records():
+                for startpos, endpos, oid_int, _prev_tid_int in state_oid_iter.items():
+                    encoded = ((endpos - startpos) << 8) + 0x52
+                    if oid_int:
+                        yield _pack(now, encoded, 8, tid_int, 0) + _pack_oid(oid_int)
+                    else:
+                        yield _pack(now, encoded, 0, tid_int, 0)
+
+            try:
+                _trace_file_writelines(records())
+            except: # pragma: no cover
+                log.exception("Problem writing trace records at tid %r", tid_int)
+                raise
+
+        self._trace_store_current = trace_store_current
+
     def trace(self, code, oid_int=0, tid_int=0, end_tid_int=0, dlen=0):
         with self._lock:
             self._trace(code, oid_int, tid_int, end_tid_int, dlen)
@@ -78,10 +101,9 @@ class ZEOTracer(object):
         # Theoretically this could be any iterable, but
         # we only work with the one defined in storage_cache.
         with self._lock:
-            now = time.time()
-            for startpos, endpos, oid_int, _prev_tid_int in state_oid_iter.items():
-                self._trace(0x52, oid_int, tid_int, dlen=endpos - startpos, now=now)
+            self._trace_store_current(tid_int, state_oid_iter)
 
     def close(self):
         self._trace_file.close()
         del self._trace
+        del self._trace_store_current
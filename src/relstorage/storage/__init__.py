@@ -392,7 +392,10 @@ class RelStorage(LegacyMethodsMixin,
             if instance is not None:
                 instance.close()
         self._instances = ()
-        logger.debug("Closing storage cache with stats %s", self._cache.stats())
+        if logger.isEnabledFor(logging.DEBUG):
+            # Collecting the stats isn't free; it counts the unique OIDs
+            # in the index.
+            logger.debug("Closing storage cache with stats %s", self._cache.stats())
         self._cache.close()
         self._cache = _ClosedCache()
         self._tpc_phase.close()
@@ -22,30 +22,138 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from tempfile import SpooledTemporaryFile
+from io import BytesIO
+from tempfile import TemporaryFile
 
-from relstorage._compat import OID_OBJECT_MAP_TYPE as OidObjectMap
-from relstorage._compat import OidObjectMap_max_key
-from relstorage._compat import iteroiditems
+from relstorage._compat import OID_TID_MAP_TYPE as OidTMap
+from relstorage._compat import OidList
 from relstorage._compat import NStringIO
 
+class _SpillBuffer(object):
+    """
+    A binary file-like object that keeps its data in memory until it
+    grows past *spill_threshold* bytes, at which point the data is moved
+    to an anonymous temporary file.
+
+    This is like :class:`tempfile.SpooledTemporaryFile`, but without
+    the extra layer of delegation. Data is only added with `append`,
+    and the number of bytes appended is kept in ``size``, so writing
+    doesn't need to seek to the end or ask the file where it is.
+    """
+    __slots__ = (
+        '_file',
+        '_spill_threshold',
+        '_at_end',
+        'in_memory',
+        'size',
+    )
+
+    def __init__(self, spill_threshold):
+        self._file = BytesIO()
+        self._spill_threshold = spill_threshold
+        # Is the file positioned at ``size``, ready to append?
+        self._at_end = True
+        self.in_memory = True
+        self.size = 0
+
+    def _spill(self):
+        old_file = self._file
+        new_file = TemporaryFile()
+        new_file.write(old_file.getvalue())
+        old_file.close()
+        new_file.seek(self.size)
+        self._file = new_file
+        self._at_end = True
+        self.in_memory = False
+
+    def append(self, data):
+        """
+        Add *data* to the end of the buffer and return the position it
+        starts at.
+        """
+        startpos = self.size
+        endpos = startpos + len(data)
+        if self.in_memory and endpos > self._spill_threshold:
+            self._spill()
+        f = self._file
+        if not self._at_end:
+            f.seek(startpos)
+            self._at_end = True
+        f.write(data)
+        self.size = endpos
+        return startpos
+
+    def reset(self):
+        """
+        Discard the contents. The buffer stays on disk if it had spilled.
+        """
+        self._file.seek(0)
+        self._at_end = True
+        self.size = 0
+
+    def seek(self, pos, whence=0):
+        self._at_end = False
+        return self._file.seek(pos, whence)
+
+    def tell(self):
+        return self._file.tell()
+
+    def read(self, length=-1):
+        self._at_end = False
+        return self._file.read(length)
+
+    def read_range(self, startpos, endpos):
+        """
+        Return the bytes from *startpos* up to *endpos*.
+        """
+        f = self._file
+        # Avoid a seek if we're reading sequentially.
+        self._at_end = False
+        if f.tell() != startpos:
+            f.seek(startpos)
+        return f.read(endpos - startpos)
+
+    def close(self):
+        self._file.close()
+
+
 class TPCTemporaryStorage(object):
     __slots__ = (
         '_queue',
         '_queue_contents',
+        '_oids',
+        '_startpos',
+        '_endpos',
+        '_prev_tid_int',
+        '_max_stored_oid',
     )
 
     def __init__(self):
         # start with a fresh in-memory buffer instead of reusing one that might
         # already be spooled to disk.
         # TODO: An alternate idea would be a temporary sqlite database.
-        self._queue = SpooledTemporaryFile(max_size=10 * 1024 * 1024)
-        # {oid: (startpos, endpos, prev_tid_int)}
-        self._queue_contents = OidObjectMap()
+        self._queue = _SpillBuffer(spill_threshold=10 * 1024 * 1024)
+        # {oid: row}, where *row* indexes the parallel ``_oids``, ``_startpos``,
+        # ``_endpos`` and ``_prev_tid_int`` columns. Keeping those as
+        # native integer arrays instead of a tuple per object saves a
+        # substantial amount of memory for large transactions.
+        # Rows are appended in the order we write to the queue, so
+        # rows are also ordered by file position.
+        self._queue_contents = OidTMap()
+        self._oids = OidList()
+        self._startpos = OidList()
+        self._endpos = OidList()
+        self._prev_tid_int = OidList()
+        self._max_stored_oid = 0
 
     def reset(self):
-        self._queue_contents.clear()
-        self._queue.seek(0)
+        self._queue_contents = OidTMap()
+        del self._oids[:]
+        del self._startpos[:]
+        del self._endpos[:]
+        del self._prev_tid_int[:]
+        self._max_stored_oid = 0
+        self._queue.reset()
 
     def store_temp(self, oid_int, state, prev_tid_int=0):
         """
@@ -54,12 +162,17 @@ class TPCTemporaryStorage(object):
         Typically, we can't actually cache the object yet, because its
         transaction ID is not yet chosen.
         """
-        queue = self._queue
-        queue.seek(0, 2)  # seek to end
-        startpos = queue.tell()
-        queue.write(state)
-        endpos = queue.tell()
-        self._queue_contents[oid_int] = (startpos, endpos, prev_tid_int)
+        # The positions are tracked arithmetically by the queue,
+        # so we don't have to seek or tell.
+        startpos = self._queue.append(state)
+        endpos = startpos + len(state)
+        self._queue_contents[oid_int] = len(self._oids)
+        self._oids.append(oid_int)
+        self._startpos.append(startpos)
+        self._endpos.append(endpos)
+        self._prev_tid_int.append(prev_tid_int)
+        if oid_int > self._max_stored_oid:
+            self._max_stored_oid = oid_int
 
     def __len__(self):
         # How many distinct OIDs have been stored?
@@ -73,13 +186,11 @@ class TPCTemporaryStorage(object):
 
     @property
     def max_stored_oid(self):
-        return OidObjectMap_max_key(self._queue_contents)
+        return self._max_stored_oid
 
     def _read_temp_state(self, startpos, endpos):
-        self._queue.seek(startpos)
-        length = endpos - startpos
-        state = self._queue.read(length)
-        if len(state) != length:
+        state = self._queue.read_range(startpos, endpos)
+        if len(state) != endpos - startpos:
             raise AssertionError("Queued cache data is truncated")
         return state
 
@@ -87,43 +198,55 @@ class TPCTemporaryStorage(object):
         """
         Return the bytes for a previously stored temporary item.
         """
-        startpos, endpos, _ = self._queue_contents[oid_int]
-        return self._read_temp_state(startpos, endpos)
+        row = self._queue_contents[oid_int]
+        return self._read_temp_state(self._startpos[row], self._endpos[row])
 
     def __iter__(self):
         return self.iter_for_oids(None)
 
     def iter_for_oids(self, oids):
-        read_temp_state = self._read_temp_state
+        # The items are ordered by file position, and unless an
+        # object was stored more than once, or we're only reading some
+        # of them, they're contiguous. Once the queue is on disk, that
+        # lets us read straight through the file, only seeking when we
+        # need to skip over something.
+        read_state = self._read_temp_state
         for startpos, endpos, oid_int, prev_tid_int in self.items(oids):
-            state = read_temp_state(startpos, endpos)
-            yield state, oid_int, prev_tid_int
+            yield read_state(startpos, endpos), oid_int, prev_tid_int
 
     def items(self, oids=None):
-        # Order the queue by file position, which should help
-        # if the file is large and needs to be read
-        # sequentially from disk.
-        items = [
-            (startpos, endpos, oid_int, prev_tid_int)
-            for (oid_int, (startpos, endpos, prev_tid_int)) in iteroiditems(self._queue_contents)
-            if oids is None or oid_int in oids
+        # Return the queue ordered by file position, which should help
+        # if the file is large and needs to be read sequentially from disk.
+        # Rows are appended in file order, so walking them in order
+        # gives us that without sorting. A row is stale, and skipped,
+        # if its OID was stored again later; if no OID was stored
+        # more than once, there are no stale rows to check for.
+        contents = self._queue_contents
+        row_oids = self._oids
+        startpos = self._startpos
+        endpos = self._endpos
+        prev_tid_int = self._prev_tid_int
+        all_current = len(contents) == len(row_oids)
+        return [
+            (startpos[row], endpos[row], oid_int, prev_tid_int[row])
+            for row, oid_int in enumerate(row_oids)
+            if (all_current or contents[oid_int] == row)
+            and (oids is None or oid_int in oids)
         ]
-        items.sort()
-        return items
 
     def close(self):
         if self._queue is not None:
             self._queue.close()
             self._queue = None
             self._queue_contents = () # Not None so len() keeps working
+            self._oids = self._startpos = self._endpos = self._prev_tid_int = ()
 
     def __repr__(self):
         approx_size = 0
         if self._queue is not None:
-            self._queue.seek(0, 2)  # seek to end
             # The number of bytes we stored isn't necessarily the
             # number of bytes we send to the server, if there are duplicates
-            approx_size = self._queue.tell()
+            approx_size = self._queue.size
         return "<%s at 0x%x count=%d bytes=%d>" % (
             type(self).__name__,
             id(self),
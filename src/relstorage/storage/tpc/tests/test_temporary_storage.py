@@ -64,3 +64,71 @@ class TestTemporaryStorage(unittest.TestCase):
             """
                    )
         )
+
+    def test_iter_skips_overwritten_data(self):
+        temp = self._makeOne()
+        temp.store_temp(1, b'abc')
+        temp.store_temp(2, b'def', 42)
+        temp.store_temp(1, b'ghij')
+        temp.store_temp(3, b'k', 23)
+
+        self.assertEqual(
+            list(temp),
+            [(b'def', 2, 42), (b'ghij', 1, 0), (b'k', 3, 23)]
+        )
+        self.assertEqual(
+            list(temp.iter_for_oids((1, 3))),
+            [(b'ghij', 1, 0), (b'k', 3, 23)]
+        )
+        # Random access still works after iterating.
+        self.assertEqual(temp.read_temp(2), b'def')
+
+
+class TestSpillBuffer(unittest.TestCase):
+
+    def _makeOne(self, spill_threshold=5):
+        from ..temporary_storage import _SpillBuffer
+        return _SpillBuffer(spill_threshold)
+
+    def test_spills_past_threshold(self):
+        buf = self._makeOne()
+        self.addCleanup(buf.close)
+        self.assertEqual(buf.append(b'abc'), 0)
+        self.assertTrue(buf.in_memory)
+        self.assertEqual(buf.read_range(1, 3), b'bc')
+        self.assertEqual(buf.append(b'de'), 3)
+        self.assertTrue(buf.in_memory)
+        self.assertEqual(buf.append(b'fgh'), 5)
+        self.assertFalse(buf.in_memory)
+        self.assertEqual(buf.size, 8)
+        self.assertEqual(buf.read_range(0, 8), b'abcdefgh')
+        self.assertEqual(buf.read_range(3, 5), b'de')
+        # Reading moved the file, but appending still goes at the end.
+        self.assertEqual(buf.append(b'ij'), 8)
+        self.assertEqual(buf.read_range(5, 10), b'fghij')
+
+    def test_read_in_memory(self):
+        buf = self._makeOne(100)
+        self.addCleanup(buf.close)
+        self.assertEqual(buf.append(b'abc'), 0)
+        self.assertEqual(buf.append(b'defg'), 3)
+        self.assertTrue(buf.in_memory)
+        # Sequential, backwards, and repeated reads.
+        self.assertEqual(buf.read_range(0, 3), b'abc')
+        self.assertEqual(buf.read_range(3, 7), b'defg')
+        self.assertEqual(buf.read_range(1, 4), b'bcd')
+        self.assertEqual(buf.read_range(1, 4), b'bcd')
+        # Appending after a read still goes at the end.
+        self.assertEqual(buf.append(b'h'), 7)
+        self.assertEqual(buf.read_range(0, 8), b'abcdefgh')
+        self.assertTrue(buf.in_memory)
+
+    def test_reset(self):
+        buf = self._makeOne(100)
+        self.addCleanup(buf.close)
+        buf.append(b'abc')
+        buf.read_range(0, 1)
+        buf.reset()
+        self.assertEqual(buf.size, 0)
+        self.assertEqual(buf.append(b'de'), 0)
+        self.assertEqual(buf.read_range(0, 2), b'de')
@@ -686,7 +686,7 @@ class GenericRelStorageTests(
             # self.assertIn('zzz:checkpoints', fakecache.data)
             # self.assertIsNotNone(db.storage._cache.polling_state.checkpoints)
             self.assertEqual(sorted(fakecache.data.keys())[-1][:10],
-                             'zzz:state:')
+                             b'zzz:state:')
             r1['alpha'] = PersistentMapping()
             transaction.commit()
             cp_count = 1
@@ -343,6 +343,15 @@ class TestOidTidMap(TestDict):
         self.assertLength(result, 3)
         self.assertEqual(dict(result), {3: 3, 4: 4, 5: 5})
 
+    def test_keys_with_other_values(self):
+        s = self._makeOne({1: 1, 2: 2, 3: 2, 4: 4})
+        result = s.keys_with_other_values(2)
+        self.assertIsInstance(result, _inthashmap.OidSet)
+        self.assertEqual(sorted(result), [1, 4])
+        self.assertEqual(sorted(s.keys_with_other_values(None)), [1, 2, 3, 4])
+        self.assertEqual(sorted(s.keys_with_other_values(42)), [1, 2, 3, 4])
+        self.assertIsEmpty(self._makeOne().keys_with_other_values(1))
+
     def test__multiunion(self):
         s = self._makeOne({1: 1, 2: 2})
         s2 = self._makeOne({2: 3, 3: 3, 4: 4})